@@ -1,6 +1,15 @@
 import warnings
 
-from qutip.qip.operations.gates import *
+from qutip.qip.operations.gates import (
+    rx, ry, rz, x_gate, y_gate, z_gate, s_gate, t_gate,
+    cy_gate, cz_gate, cs_gate, ct_gate, sqrtnot, snot,
+    phasegate, qrot, cphase, cnot, qasmu_gate,
+    csign, berkeley, swapalpha, swap, iswap, sqrtswap,
+    sqrtiswap, fredkin, molmer_sorensen,
+    toffoli, rotation, controlled_gate,
+    globalphase, hadamard_transform, gate_sequence_product,
+    gate_expand_1toN, gate_expand_2toN, gate_expand_3toN,
+    qubit_clifford_group, expand_operator)
 warnings.warn(
     "Importation from qutip.qip.gates is deprecated."
     "Please use e.g.\n from qutip.qip.operations import cnot\n",
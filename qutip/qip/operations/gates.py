@@ -1,7 +1,7 @@
 import numbers
 from collections.abc import Iterable
 from itertools import product, chain
-from functools import partial, reduce
+from functools import lru_cache, partial, reduce
 from operator import mul
 
 import numpy as np
@@ -22,6 +22,61 @@ __all__ = ['rx', 'ry', 'rz', 'sqrtnot', 'snot', 'phasegate', 'qrot',
            'gate_expand_1toN', 'gate_expand_2toN', 'gate_expand_3toN',
            'qubit_clifford_group', 'expand_operator']
 
+
+@lru_cache(maxsize=None)
+def _perm_gate(perm):
+    """
+    Quantum object of the qubit permutation gate that maps the computational
+    basis state ``|i>`` to ``|perm[i]>``. The sparse matrix is assembled
+    directly from the permutation, without building a dense matrix first.
+
+    ``perm`` must be a tuple, as the result is cached. Callers should return
+    a copy so that the cached gate cannot be modified.
+    """
+    N = len(perm)
+    n = N.bit_length() - 1
+    data = sp.csr_matrix((np.ones(N, dtype=complex), (perm, np.arange(N))),
+                         shape=(N, N))
+    return Qobj(data, dims=[[2] * n, [2] * n])
+
+
+def _expand_perm_gate(perm, N, targets):
+    """
+    Quantum object of the qubit permutation gate ``perm`` acting on the
+    qubits ``targets`` of an N-qubit system.
+
+    The expanded permutation is computed with bit masks on the basis indices,
+    so that no tensor product or permutation of the operator is needed.
+    """
+    targets = _targets_to_list(targets, N=N)
+    if not all([t >= -N for t in targets]):
+        raise ValueError("Targets must not be smaller than -N={}.".format(-N))
+    # Negative indices count from the last qubit, as in gate_expand_2toN.
+    targets = [t % N for t in targets]
+    if len(set(targets)) != len(targets):
+        raise ValueError("Targets must be different from each other.")
+    n = len(targets)
+    if len(perm) != 2 ** n:
+        raise ValueError("The permutation acts on {} qubits, "
+                         "but {} targets given.".format(
+                             len(perm).bit_length() - 1, n))
+    # Qubit 0 is the most significant bit of the basis index.
+    shifts = [N - 1 - t for t in targets]
+    inds = np.arange(2 ** N)
+    sub_inds = np.zeros_like(inds)
+    mask = 0
+    for k, shift in enumerate(shifts):
+        sub_inds |= ((inds >> shift) & 1) << (n - 1 - k)
+        mask |= 1 << shift
+    new_sub_inds = np.asarray(perm)[sub_inds]
+    rows = inds & ~mask
+    for k, shift in enumerate(shifts):
+        rows |= ((new_sub_inds >> (n - 1 - k)) & 1) << shift
+    data = sp.csr_matrix((np.ones(2 ** N, dtype=complex), (rows, inds)),
+                         shape=(2 ** N, 2 ** N))
+    return Qobj(data, dims=[[2] * N, [2] * N])
+
+
 #
 # Single Qubit Gates
 #
@@ -38,8 +93,8 @@ def x_gate(N=None, target=0):
 
     """
     if N is not None:
-        return gate_expand_1toN(x_gate(), N, target)
-    return sigmax()
+        return _expand_perm_gate((1, 0), N, [target])
+    return _perm_gate((1, 0)).copy()
 
 
 def y_gate(N=None, target=0):
@@ -267,8 +322,16 @@ shape = [2, 2], type = oper, isHerm = True
     """
     if N is not None:
         return gate_expand_1toN(snot(), N, target)
-    return 1 / np.sqrt(2.0) * Qobj([[1, 1],
-                                    [1, -1]])
+    return _snot().copy()
+
+
+_HADAMARD = np.array([[1.0, 1.0],
+                      [1.0, -1.0]]) / np.sqrt(2.0)
+
+
+@lru_cache(maxsize=None)
+def _snot():
+    return Qobj(_HADAMARD, isherm=True, isunitary=True)
 
 
 def phasegate(theta, N=None, target=0):
@@ -435,12 +498,8 @@ shape = [4, 4], type = oper, isHerm = True
         N = 2
 
     if N is not None:
-        return gate_expand_2toN(cnot(), N, control, target)
-    return Qobj([[1, 0, 0, 0],
-                 [0, 1, 0, 0],
-                 [0, 0, 0, 1],
-                 [0, 0, 1, 0]],
-                dims=[[2, 2], [2, 2]])
+        return _expand_perm_gate((0, 1, 3, 2), N, [control, target])
+    return _perm_gate((0, 1, 3, 2)).copy()
 
 
 def csign(N=None, control=0, target=1):
@@ -570,12 +629,8 @@ shape = [4, 4], type = oper, isHerm = True
         N = 2
 
     if N is not None:
-        return gate_expand_2toN(swap(), N, targets=targets)
-    return Qobj([[1, 0, 0, 0],
-                 [0, 0, 1, 0],
-                 [0, 1, 0, 0],
-                 [0, 0, 0, 1]],
-                dims=[[2, 2], [2, 2]])
+        return _expand_perm_gate((0, 2, 1, 3), N, targets)
+    return _perm_gate((0, 2, 1, 3)).copy()
 
 
 def iswap(N=None, targets=[0, 1]):
@@ -730,17 +785,9 @@ shape = [8, 8], type = oper, isHerm = True
         N = 3
 
     if N is not None:
-        return gate_expand_3toN(fredkin(), N,
-                                [control, targets[0]], targets[1])
-    return Qobj([[1, 0, 0, 0, 0, 0, 0, 0],
-                 [0, 1, 0, 0, 0, 0, 0, 0],
-                 [0, 0, 1, 0, 0, 0, 0, 0],
-                 [0, 0, 0, 1, 0, 0, 0, 0],
-                 [0, 0, 0, 0, 1, 0, 0, 0],
-                 [0, 0, 0, 0, 0, 0, 1, 0],
-                 [0, 0, 0, 0, 0, 1, 0, 0],
-                 [0, 0, 0, 0, 0, 0, 0, 1]],
-                dims=[[2, 2, 2], [2, 2, 2]])
+        return _expand_perm_gate((0, 1, 2, 3, 4, 6, 5, 7), N,
+                                 [control, targets[0], targets[1]])
+    return _perm_gate((0, 1, 2, 3, 4, 6, 5, 7)).copy()
 
 
 def toffoli(N=None, controls=[0, 1], target=2):
@@ -772,16 +819,9 @@ def toffoli(N=None, controls=[0, 1], target=2):
         N = 3
 
     if N is not None:
-        return gate_expand_3toN(toffoli(), N, controls, target)
-    return Qobj([[1, 0, 0, 0, 0, 0, 0, 0],
-                 [0, 1, 0, 0, 0, 0, 0, 0],
-                 [0, 0, 1, 0, 0, 0, 0, 0],
-                 [0, 0, 0, 1, 0, 0, 0, 0],
-                 [0, 0, 0, 0, 1, 0, 0, 0],
-                 [0, 0, 0, 0, 0, 1, 0, 0],
-                 [0, 0, 0, 0, 0, 0, 0, 1],
-                 [0, 0, 0, 0, 0, 0, 1, 0]],
-                dims=[[2, 2, 2], [2, 2, 2]])
+        return _expand_perm_gate((0, 1, 2, 3, 4, 5, 7, 6), N,
+                                 [controls[0], controls[1], target])
+    return _perm_gate((0, 1, 2, 3, 4, 5, 7, 6)).copy()
 
 
 #
@@ -892,9 +932,7 @@ def hadamard_transform(N=1):
         Quantum object representation of the N-qubit Hadamard gate.
 
     """
-    H = Qobj([[1, 1], [1, -1]]) / np.sqrt(2)
-
-    return tensor([H] * N)
+    return tensor([snot()] * N)
 
 
 def _flatten(lst):
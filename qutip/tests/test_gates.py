@@ -122,6 +122,25 @@ class TestExplicitForm:
         expected = base.permute(_apply_permutation(permutation))
         assert test == expected
 
+    @pytest.mark.parametrize(['state', 'expected'], [
+        pytest.param([1, 0, 1], [1, 1, 0], id="swap 101"),
+        pytest.param([1, 1, 0], [1, 0, 1], id="swap 110"),
+        pytest.param([0, 1, 0], [0, 1, 0], id="no control 010"),
+        pytest.param([1, 1, 1], [1, 1, 1], id="equal targets 111"),
+    ])
+    def test_fredkin(self, state, expected):
+        test = gates.fredkin() * qutip.basis([2, 2, 2], state)
+        assert test == qutip.basis([2, 2, 2], expected)
+
+    @pytest.mark.parametrize('gate', [gates.x_gate, gates.snot, gates.cnot,
+                                      gates.swap, gates.fredkin,
+                                      gates.toffoli])
+    def test_cached_gate_is_not_shared(self, gate):
+        first = gate()
+        expected = first.full()
+        first.data.data[:] = 0
+        np.testing.assert_allclose(gate().full(), expected)
+
     @pytest.mark.parametrize(['angle', 'expected'], [
         pytest.param(np.pi, -1j*qutip.tensor(qutip.sigmax(), qutip.sigmax()),
                      id="pi"),
@@ -255,6 +274,45 @@ class TestGateExpansion:
                                                  [q1, q2, q3])
             assert _infidelity(test, expected) < 1e-12
 
+    @pytest.mark.parametrize(['gate', 'n_targets', 'make_args'], [
+        pytest.param(gates.x_gate, 1, lambda q: [q[0]], id="X"),
+        pytest.param(gates.cnot, 2, lambda q: [q[0], q[1]], id="cnot"),
+        pytest.param(gates.swap, 2, lambda q: [list(q)], id="swap"),
+        pytest.param(gates.fredkin, 3, lambda q: [q[0], [q[1], q[2]]],
+                     id="Fredkin"),
+        pytest.param(gates.toffoli, 3, lambda q: [[q[0], q[1]], q[2]],
+                     id="Toffoli"),
+    ])
+    def test_permutation_gate_matches_expand_operator(self, gate, n_targets,
+                                                      make_args):
+        for qubits in itertools.permutations(range(self.n_qubits),
+                                             n_targets):
+            test = gate(self.n_qubits, *make_args(qubits))
+            expected = gates.expand_operator(gate(), self.n_qubits,
+                                             list(qubits))
+            assert test == expected
+
+    def test_permutation_gate_negative_targets(self):
+        assert gates.x_gate(3, -1) == gates.x_gate(3, 2)
+        assert gates.cnot(3, -1, 0) == gates.cnot(3, 2, 0)
+        assert gates.swap(3, [-3, -1]) == gates.swap(3, [0, 2])
+        assert gates.fredkin(3, -2, [0, -1]) == gates.fredkin(3, 1, [0, 2])
+        assert gates.toffoli(4, [-1, 0], -3) == gates.toffoli(4, [3, 0], 1)
+
+    def test_permutation_gate_invalid_targets(self):
+        with pytest.raises(ValueError):
+            gates.cnot(3, 1, 1)
+        with pytest.raises(ValueError):
+            gates.cnot(3, -1, 2)
+        with pytest.raises(ValueError):
+            gates.cnot(3, -4, 0)
+        with pytest.raises(ValueError):
+            gates.toffoli(3, [0, 1], 3)
+        with pytest.raises(ValueError):
+            gates.x_gate(3, -4)
+        with pytest.raises(ValueError):
+            gates.swap(3, [0, -3])
+
 
 class Test_expand_operator:
     # Conceptually, a lot of these tests are complete duplicates of
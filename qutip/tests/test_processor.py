@@ -1,5 +1,3 @@
-import os
-
 from numpy.testing import (
     assert_, run_module_suite, assert_allclose, assert_equal)
 import numpy as np
@@ -21,6 +19,9 @@ from qutip.qip.circuit import QubitCircuit
 import pytest
 
 
+_RNG = np.random.default_rng(0)
+
+
 class TestCircuitProcessor:
     def test_modify_ctrls(self):
         """
@@ -42,7 +43,7 @@ class TestCircuitProcessor:
         proc.remove_pulse(0)
         assert_allclose(len(proc.ctrls), 0)
 
-    def test_save_read(self):
+    def test_save_read(self, tmp_path):
         """
         Test for saving and reading a pulse matrix
         """
@@ -61,15 +62,14 @@ class TestCircuitProcessor:
         proc.pulses[0].coeff = amp1
         proc.pulses[1].tlist = tlist
         proc.pulses[1].coeff = amp2
-        proc.save_coeff("qutip_test_CircuitProcessor.txt")
-        proc1.read_coeff("qutip_test_CircuitProcessor.txt")
-        os.remove("qutip_test_CircuitProcessor.txt")
+        file_name = str(tmp_path / "qutip_test_CircuitProcessor.txt")
+        proc.save_coeff(file_name)
+        proc1.read_coeff(file_name)
         assert_allclose(proc1.get_full_coeffs(), proc.get_full_coeffs())
         assert_allclose(proc1.get_full_tlist(), proc.get_full_tlist())
-        proc.save_coeff("qutip_test_CircuitProcessor.txt", inctime=False)
-        proc2.read_coeff("qutip_test_CircuitProcessor.txt", inctime=False)
+        proc.save_coeff(file_name, inctime=False)
+        proc2.read_coeff(file_name, inctime=False)
         proc2.set_all_tlist(tlist)
-        os.remove("qutip_test_CircuitProcessor.txt")
         assert_allclose(proc2.get_full_coeffs(), proc.get_full_coeffs())
 
     def test_id_evolution(self):
@@ -86,32 +86,50 @@ class TestCircuitProcessor:
         global_phase = init_state.data[0, 0]/result.final_state.data[0, 0]
         assert_allclose(global_phase*result.final_state, init_state)
 
-    def test_id_with_T1_T2(self):
+    @pytest.fixture(scope="class")
+    def destroy2(self):
+        return destroy(2)
+
+    @pytest.fixture(scope="class")
+    def hadamard1(self):
+        return hadamard_transform(1)
+
+    @pytest.fixture(scope="class")
+    def id_tlist(self):
+        return np.arange(0, 2. + 0.02, 0.02)
+
+    def test_id_with_T1_T2(self, id_tlist, destroy2, hadamard1):
         """
         Test for identity evolution with relaxation t1 and t2
         """
         # setup
-        a = destroy(2)
-        Hadamard = hadamard_transform(1)
+        a = destroy2
+        Hadamard = hadamard1
         ex_state = basis(2, 1)
         mines_state = (basis(2, 1)-basis(2, 0)).unit()
-        end_time = 2.
-        tlist = np.arange(0, end_time + 0.02, 0.02)
+        end_time = id_tlist[-1]
         t1 = 1.
         t2 = 0.5
+        # Options(rhs_reuse=True) is not used for the runs below: it would
+        # reuse the saved solver system of the previous run, including the
+        # collapse operators built from the previous t1 and t2.
+        test = Processor(1)
+        # zero ham evolution
+        test.add_pulse(Pulse(identity(2), 0, id_tlist, False))
 
         # test t1
-        test = Processor(1, t1=t1)
-        # zero ham evolution
-        test.add_pulse(Pulse(identity(2), 0, tlist, False))
+        test.t1 = t1
         result = test.run_state(ex_state, e_ops=[a.dag()*a])
         assert_allclose(
             result.expect[0][-1], np.exp(-1./t1*end_time),
             rtol=1e-5, err_msg="Error in t1 time simulation")
 
         # test t2
-        test = Processor(1, t2=t2)
-        test.add_pulse(Pulse(identity(2), 0, tlist, False))
+        # run_state appends the relaxation noise to Processor.noise,
+        # so it has to be cleared before changing t1 and t2.
+        test.noise = []
+        test.t1 = None
+        test.t2 = t2
         result = test.run_state(
             init_state=mines_state, e_ops=[Hadamard*a.dag()*a*Hadamard])
         assert_allclose(
@@ -119,10 +137,11 @@ class TestCircuitProcessor:
             rtol=1e-5, err_msg="Error in t2 time simulation")
 
         # test t1 and t2
-        t1 = np.random.rand(1) + 0.5
-        t2 = np.random.rand(1) * 0.5 + 0.5
-        test = Processor(1, t1=t1, t2=t2)
-        test.add_pulse(Pulse(identity(2), 0, tlist, False))
+        t1 = _RNG.random(1) + 0.5
+        t2 = _RNG.random(1) * 0.5 + 0.5
+        test.noise = []
+        test.t1 = t1
+        test.t2 = t2
         result = test.run_state(
             init_state=mines_state, e_ops=[Hadamard*a.dag()*a*Hadamard])
         assert_allclose(
@@ -131,20 +150,30 @@ class TestCircuitProcessor:
             err_msg="Error in t1 & t2 simulation, "
                     "with t1={} and t2={}".format(t1, t2))
 
-    def testPlot(self):
+    @pytest.fixture
+    def agg_backend(self):
+        """
+        Render off-screen with the Agg backend for the duration of a test,
+        restoring the previous backend afterwards.
+        """
+        matplotlib = pytest.importorskip("matplotlib")
+        old_backend = matplotlib.get_backend()
+        matplotlib.use("Agg")
+        yield
+        matplotlib.use(old_backend)
+
+    @pytest.mark.slow
+    def testPlot(self, agg_backend):
         """
         Test for plotting functions
         """
-        try:
-            import matplotlib.pyplot as plt
-        except Exception:
-            return True
+        import matplotlib.pyplot as plt
         # step_func
         tlist = np.linspace(0., 2*np.pi, 20)
         processor = Processor(N=1, spline_kind="step_func")
         processor.add_control(sigmaz())
         processor.pulses[0].tlist = tlist
-        processor.pulses[0].coeff = np.array([np.sin(t) for t in tlist])
+        processor.pulses[0].coeff = np.sin(tlist)
         fig, _ = processor.plot_pulses()
         # testing under Xvfb with pytest-xvfb complains if figure windows are
         # left open, so we politely close it:
@@ -155,52 +184,44 @@ class TestCircuitProcessor:
         processor = Processor(N=1, spline_kind="cubic")
         processor.add_control(sigmaz())
         processor.pulses[0].tlist = tlist
-        processor.pulses[0].coeff = np.array([np.sin(t) for t in tlist])
+        processor.pulses[0].coeff = np.sin(tlist)
         fig, _ = processor.plot_pulses()
         # testing under Xvfb with pytest-xvfb complains if figure windows are
         # left open, so we politely close it:
         plt.close(fig)
 
-    def testSpline(self):
+    @pytest.fixture
+    def tlist(self):
+        return np.array([1, 2, 3, 4, 5, 6], dtype=float)
+
+    @pytest.fixture
+    def coeff(self):
+        return np.array([1, 1, 1, 1, 1, 1], dtype=float)
+
+    @pytest.mark.parametrize(["spline_kind", "step_func"], [
+        pytest.param("step_func", True, id="step_func"),
+        pytest.param("cubic", False, id="cubic"),
+    ])
+    def testSpline(self, tlist, coeff, spline_kind, step_func):
         """
         Test if the spline kind is correctly transfered into
         the arguments in QobjEvo
         """
-        tlist = np.array([1, 2, 3, 4, 5, 6], dtype=float)
-        coeff = np.array([1, 1, 1, 1, 1, 1], dtype=float)
-        processor = Processor(N=1, spline_kind="step_func")
-        processor.add_control(sigmaz())
-        processor.pulses[0].tlist = tlist
-        processor.pulses[0].coeff = coeff
-
-        ideal_qobjevo, _ = processor.get_qobjevo(noisy=False)
-        assert_(ideal_qobjevo.args["_step_func_coeff"])
-        noisy_qobjevo, c_ops = processor.get_qobjevo(noisy=True)
-        assert_(noisy_qobjevo.args["_step_func_coeff"])
-        processor.T1 = 100.
-        processor.add_noise(ControlAmpNoise(coeff=coeff, tlist=tlist))
-        noisy_qobjevo, c_ops = processor.get_qobjevo(noisy=True)
-        assert_(noisy_qobjevo.args["_step_func_coeff"])
-
-        tlist = np.array([1, 2, 3, 4, 5, 6], dtype=float)
-        coeff = np.array([1, 1, 1, 1, 1, 1], dtype=float)
-        processor = Processor(N=1, spline_kind="cubic")
+        processor = Processor(N=1, spline_kind=spline_kind)
         processor.add_control(sigmaz())
         processor.pulses[0].tlist = tlist
         processor.pulses[0].coeff = coeff
 
         ideal_qobjevo, _ = processor.get_qobjevo(noisy=False)
-        assert_(not ideal_qobjevo.args["_step_func_coeff"])
+        assert_equal(ideal_qobjevo.args["_step_func_coeff"], step_func)
         noisy_qobjevo, c_ops = processor.get_qobjevo(noisy=True)
-        assert_(not noisy_qobjevo.args["_step_func_coeff"])
+        assert_equal(noisy_qobjevo.args["_step_func_coeff"], step_func)
         processor.T1 = 100.
         processor.add_noise(ControlAmpNoise(coeff=coeff, tlist=tlist))
         noisy_qobjevo, c_ops = processor.get_qobjevo(noisy=True)
-        assert_(not noisy_qobjevo.args["_step_func_coeff"])
+        assert_equal(noisy_qobjevo.args["_step_func_coeff"], step_func)
 
-    def testGetObjevo(self):
-        tlist = np.array([1, 2, 3, 4, 5, 6], dtype=float)
-        coeff = np.array([1, 1, 1, 1, 1, 1], dtype=float)
+    def testGetObjevo(self, tlist, coeff):
         processor = Processor(N=1)
         processor.add_control(sigmaz())
         processor.pulses[0].tlist = tlist
@@ -236,7 +257,7 @@ class TestCircuitProcessor:
         processor = Processor(N=1, spline_kind="cubic")
         processor.add_control(sigmaz())
         tlist = np.linspace(1, 6, int(5/0.2))
-        coeff = np.random.rand(len(tlist))
+        coeff = _RNG.random(len(tlist))
         processor.pulses[0].tlist = tlist
         processor.pulses[0].coeff = coeff
 
@@ -252,14 +273,14 @@ class TestCircuitProcessor:
         assert_equal(sigmaz(), noisy_qobjevo.ops[0].qobj)
         assert_allclose(coeff, noisy_qobjevo.ops[0].coeff, rtol=1.e-10)
 
-    def testNoise(self):
+    def testNoise(self, destroy2):
         """
         Test for Processor with noise
         """
         # setup and fidelity without noise
         init_state = qubit_states(2, [0, 0, 0, 0])
         tlist = np.array([0., np.pi/2.])
-        a = destroy(2)
+        a = destroy2
         proc = Processor(N=2)
         proc.add_control(sigmax(), targets=1)
         proc.pulses[0].tlist = tlist
@@ -279,7 +300,7 @@ class TestCircuitProcessor:
 
         # white random noise
         proc.noise = []
-        white_noise = RandomNoise(0.2, np.random.normal, loc=0.1, scale=0.1)
+        white_noise = RandomNoise(0.2, _RNG.normal, loc=0.1, scale=0.1)
         proc.add_noise(white_noise)
         result = proc.run_state(init_state=init_state)
 
@@ -317,7 +338,6 @@ class TestCircuitProcessor:
         # setup and fidelity without noise
         init_state = qubit_states(2, [0, 0, 0, 0])
         tlist = np.array([0., np.pi/2.])
-        a = destroy(2)
         proc = Processor(N=2)
         proc.add_control(sigmax(), targets=1)
         proc.pulses[0].tlist = tlist